@@ -1,32 +1,154 @@
 """Database models and session management."""
 
-from sqlalchemy import create_engine
-from sqlalchemy.orm import declarative_base, sessionmaker
+import logging
+import ssl
+from typing import Any, Optional, Union
+from uuid import uuid4
 
-from app.config import get_settings
+from sqlalchemy.engine import make_url
+from sqlalchemy.ext.asyncio import AsyncEngine, async_sessionmaker, create_async_engine
+from sqlalchemy.orm import declarative_base
+from sqlalchemy.pool import NullPool
+
+from app.config import Settings, get_settings
 
 settings = get_settings()
 
-# Create database engine
-engine = create_engine(
-    settings.database_url,
-    echo=settings.database_echo,
-    pool_pre_ping=True,
-    pool_size=10,
-    max_overflow=20,
+logger = logging.getLogger(__name__)
+
+# URL query parameters that the asyncpg dialect reads itself or forwards to asyncpg.connect()
+_ASYNCPG_QUERY_PARAMS = frozenset(
+    {
+        "host",
+        "port",
+        "ssl",
+        "target_session_attrs",
+        "passfile",
+        "service",
+        "servicefile",
+        "krbsrvname",
+        "gsslib",
+        "prepared_statement_cache_size",
+    }
 )
 
+# libpq certificate parameters, which asyncpg only takes as an SSLContext
+_SSL_FILE_PARAMS = ("sslrootcert", "sslcert", "sslkey")
+
+
+def _pop_param(query: dict[str, Union[str, tuple[str, ...]]], name: str) -> Optional[str]:
+    """Pop a single-valued URL query parameter; like libpq, the last occurrence wins."""
+    value = query.pop(name, None)
+    if isinstance(value, tuple):
+        return value[-1]
+    return value
+
+
+def _create_ssl_context(sslmode: str, files: dict[str, str]) -> ssl.SSLContext:
+    """Build an SSLContext matching libpq's ``sslmode`` and certificate file parameters."""
+    if sslmode in ("disable", "allow"):
+        raise ValueError(f"sslmode={sslmode} cannot be combined with {', '.join(files)}")
+
+    context = ssl.create_default_context(cafile=files.get("sslrootcert"))
+    if "sslcert" in files:
+        context.load_cert_chain(files["sslcert"], keyfile=files.get("sslkey"))
+
+    if sslmode != "verify-full":
+        context.check_hostname = False
+        # Like libpq, a root certificate upgrades require/prefer to verify-ca
+        if sslmode != "verify-ca" and "sslrootcert" not in files:
+            context.verify_mode = ssl.CERT_NONE
+    return context
+
+
+def get_async_connection_options(database_url: str) -> tuple[str, dict[str, Any]]:
+    """Return the asyncpg URL and connect args for a PostgreSQL connection string.
+
+    libpq query parameters are translated where asyncpg has an equivalent:
+    ``sslmode`` becomes ``ssl``, certificate files become an SSLContext,
+    ``connect_timeout`` becomes ``timeout`` and ``application_name`` is sent as a
+    server setting. Anything else asyncpg would reject is dropped with a warning.
+    Non-PostgreSQL URLs are returned unchanged.
+    """
+    url = make_url(database_url)
+    if url.get_backend_name() != "postgresql":
+        return database_url, {}
+
+    query = dict(url.query)
+    connect_args: dict[str, Any] = {}
+
+    sslmode = _pop_param(query, "sslmode")
+    files = {name: value for name in _SSL_FILE_PARAMS if (value := _pop_param(query, name))}
+    if files:
+        connect_args["ssl"] = _create_ssl_context(sslmode or "prefer", files)
+    elif sslmode is not None:
+        query.setdefault("ssl", sslmode)
+
+    connect_timeout = _pop_param(query, "connect_timeout")
+    if connect_timeout is not None:
+        connect_args["timeout"] = float(connect_timeout)
+    application_name = _pop_param(query, "application_name")
+    if application_name is not None:
+        connect_args["server_settings"] = {"application_name": application_name}
+
+    unsupported = sorted(set(query) - _ASYNCPG_QUERY_PARAMS)
+    if unsupported:
+        logger.warning(
+            "Ignoring database URL parameters not supported by asyncpg: %s",
+            ", ".join(unsupported),
+        )
+    query = {key: value for key, value in query.items() if key in _ASYNCPG_QUERY_PARAMS}
+
+    url = url.set(drivername="postgresql+asyncpg", query=query)
+    return url.render_as_string(hide_password=False), connect_args
+
+
+def get_engine_options(settings: Settings, database_url: str) -> dict[str, Any]:
+    """Return the connection pool options for an engine connecting to ``database_url``."""
+    if settings.database_behind_pgbouncer:
+        options: dict[str, Any] = {"poolclass": NullPool}
+        if make_url(database_url).get_driver_name() == "asyncpg":
+            # PgBouncer in transaction mode can hand each transaction a different server
+            # connection, so asyncpg must not reuse or cache prepared statement names.
+            options["connect_args"] = {
+                "prepared_statement_name_func": lambda: f"__asyncpg_{uuid4()}__",
+                "statement_cache_size": 0,
+                "prepared_statement_cache_size": 0,
+            }
+        return options
+    return {
+        "pool_pre_ping": True,
+        "pool_size": settings.database_pool_size,
+        "max_overflow": settings.database_max_overflow,
+        "pool_timeout": settings.database_pool_timeout,
+        "pool_recycle": settings.database_pool_recycle,
+    }
+
+
+def create_database_engine(settings: Settings) -> AsyncEngine:
+    """Create the async database engine for the configured connection string."""
+    database_url, connect_args = get_async_connection_options(settings.database_url)
+    options = get_engine_options(settings, database_url)
+    connect_args.update(options.pop("connect_args", {}))
+    return create_async_engine(
+        database_url,
+        echo=settings.database_echo,
+        connect_args=connect_args,
+        **options,
+    )
+
+
+# Create database engine
+async_engine = create_database_engine(settings)
+
 # Create session factory
-SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+AsyncSessionLocal = async_sessionmaker(async_engine, autoflush=False, expire_on_commit=False)
 
 # Base class for declarative models
 Base = declarative_base()
 
 
-def get_db():
-    """Get database session dependency."""
-    db = SessionLocal()
-    try:
+async def get_db():
+    """Get async database session dependency."""
+    async with AsyncSessionLocal() as db:
         yield db
-    finally:
-        db.close()
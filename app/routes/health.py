@@ -4,7 +4,7 @@ from typing import Any
 
 from fastapi import APIRouter, Depends
 from sqlalchemy import text
-from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.database import get_db
 
@@ -18,11 +18,11 @@ async def health_check() -> dict[str, str]:
 
 
 @router.get("/health/db")
-async def database_health_check(db: Session = Depends(get_db)) -> dict[str, Any]:
+async def database_health_check(db: AsyncSession = Depends(get_db)) -> dict[str, Any]:
     """Health check endpoint that verifies database connectivity."""
     try:
         # Execute a simple query to verify database connection
-        result = db.execute(text("SELECT 1"))
+        result = await db.execute(text("SELECT 1"))
         result.fetchone()
         return {
             "status": "healthy",
@@ -1,5 +1,8 @@
 """Tests for application configuration."""
 
+import pytest
+from pydantic import ValidationError
+
 from app.config import Settings, get_settings
 
 
@@ -18,3 +21,25 @@ def test_get_settings_cached():
     settings1 = get_settings()
     settings2 = get_settings()
     assert settings1 is settings2
+
+
+def test_settings_frozen():
+    """Test that settings cannot be mutated after load."""
+    settings = get_settings()
+    with pytest.raises(ValidationError):
+        settings.debug = True
+
+
+@pytest.mark.parametrize(
+    "field, value",
+    [
+        ("database_pool_size", 0),
+        ("database_max_overflow", -1),
+        ("database_pool_timeout", 0),
+        ("database_pool_recycle", -1),
+    ],
+)
+def test_database_pool_settings_validated(field, value):
+    """Test that pool settings reject out-of-range values."""
+    with pytest.raises(ValidationError):
+        Settings(**{field: value})